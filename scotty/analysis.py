@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Dict, Optional, Union
 
 import numpy as np
-from scipy import constants
+from scipy import constants, integrate
 import xarray as xr
 
 from scotty.check_output import check_output
@@ -20,7 +20,6 @@ from scotty.derivatives import derivative
 from scotty.fun_general import (
     K_magnitude,
     dot,
-    find_nearest,
     find_normalised_gyro_freq,
     find_normalised_plasma_freq,
     make_unit_vector_from_cross_product,
@@ -53,12 +52,53 @@ def set_vector_components_long_name(df: Union[xr.Dataset, xr.DataArray]) -> None
         df.row_cart.attrs["long_name"] = "Matrix row component"
 
 
+#: Variables that are only kept for diagnostics and plotting, and so don't
+#: need to be stored in double precision. None of these are used in any
+#: further calculations once `further_analysis` is done with them
+DIAGNOSTIC_VARIABLES = (
+    "B_R",
+    "B_T",
+    "B_Z",
+    "dpolflux_dR",
+    "dpolflux_dZ",
+    "normalised_plasma_freqs",
+    "normalised_gyro_freqs",
+    "poloidal_flux_on_midplane",
+    "kappa_dot_xhat",
+    "kappa_dot_yhat",
+    "kappa_dot_ghat",
+    "kappa_magnitude",
+    "d_theta_d_tau",
+    "d_xhat_d_tau_dot_yhat",
+)
+
+_SINGLE_PRECISION = {
+    np.dtype(np.float64): np.float32,
+    np.dtype(np.complex128): np.complex64,
+}
+
+
+def _to_single_precision(array: ArrayLike) -> ArrayLike:
+    """Convert double precision real or complex ``array`` to single precision"""
+    try:
+        return array.astype(_SINGLE_PRECISION[array.dtype])
+    except KeyError:
+        return array
+
+
+def downcast_diagnostics(df: xr.Dataset) -> None:
+    """Store the `DIAGNOSTIC_VARIABLES` in ``df`` in single precision, in place"""
+    for name in DIAGNOSTIC_VARIABLES:
+        if name in df:
+            df[name] = _to_single_precision(df[name])
+
+
 def save_npz(filename: Path, df: xr.Dataset) -> None:
     """Save xarray dataset to numpy .npz file"""
     np.savez(
         filename,
-        **{str(k): v for k, v in df.items()},
-        **{str(k): v.data for k, v in df.coords.items()},
+        **{str(k): np.ascontiguousarray(v.values) for k, v in df.items()},
+        **{str(k): np.ascontiguousarray(v.values) for k, v in df.coords.items()},
     )
 
 
@@ -83,7 +123,16 @@ def immediate_analysis(
     output_path: Path,
     output_filename_suffix: str,
     dH: Dict[str, ArrayLike],
+    debug: bool = False,
 ):
+    """Compute quantities along the beam that follow directly from the
+    solver output
+
+    If ``debug`` is true, also compute ``H_Booker_other``, the
+    Hamiltonian of the other mode, and print the final value of
+    ``H_Booker``. These are only useful for checking that the beam
+    tracer is working properly, so are skipped by default.
+    """
     q_R = solver_output.q_R
     q_Z = solver_output.q_Z
     tau = solver_output.tau
@@ -92,7 +141,14 @@ def immediate_analysis(
 
     numberOfDataPoints = len(tau)
 
-    poloidal_flux = field.poloidal_flux(q_R, q_Z)
+    # Calculates B, b_hat and poloidal flux
+    field_values = field.evaluate_all(q_R.values, q_Z.values)
+    B_R = field_values["B_R"]
+    B_T = field_values["B_T"]
+    B_Z = field_values["B_Z"]
+    B_magnitude = field_values["B_magnitude"]
+    b_hat = field_values["b_hat"]
+    poloidal_flux = field_values["poloidal_flux"]
 
     dH_dR = dH["dH_dR"]
     dH_dZ = dH["dH_dZ"]
@@ -101,22 +157,26 @@ def immediate_analysis(
     dH_dKZ = dH["dH_dKZ"]
 
     g_magnitude = (q_R**2 * dH_dKzeta**2 + dH_dKR**2 + dH_dKZ**2) ** 0.5
-    g_hat = (np.block([[dH_dKR], [q_R * dH_dKzeta], [dH_dKZ]]) / g_magnitude.data).T
-
-    # Calculates b_hat and grad_b_hat
-    B_R = field.B_R(q_R, q_Z)
-    B_T = field.B_T(q_R, q_Z)
-    B_Z = field.B_Z(q_R, q_Z)
-    B_magnitude = field.magnitude(q_R, q_Z)
-    b_hat = field.unit(q_R, q_Z)
-
-    dbhat_dR = derivative(
-        field.unit, dims="q_R", args={"q_R": q_R, "q_Z": q_Z}, spacings=delta_R
-    )
-    dbhat_dZ = derivative(
-        field.unit, dims="q_Z", args={"q_R": q_R, "q_Z": q_Z}, spacings=delta_Z
+    g_hat = (
+        np.stack([dH_dKR, q_R.values * dH_dKzeta, dH_dKZ], axis=-1)
+        / g_magnitude.values[:, np.newaxis]
     )
 
+    # Calculates grad_b_hat. Central differences in R and Z, with all four
+    # stencil points evaluated in a single call to the field
+    q_R_array = q_R.values
+    q_Z_array = q_Z.values
+    b_hat_stencil = field.unit(
+        np.concatenate(
+            [q_R_array + delta_R, q_R_array - delta_R, q_R_array, q_R_array]
+        ),
+        np.concatenate(
+            [q_Z_array, q_Z_array, q_Z_array + delta_Z, q_Z_array - delta_Z]
+        ),
+    ).reshape(4, numberOfDataPoints, 3)
+    dbhat_dR = (b_hat_stencil[0] - b_hat_stencil[1]) / (2 * delta_R)
+    dbhat_dZ = (b_hat_stencil[2] - b_hat_stencil[3]) / (2 * delta_Z)
+
     # Transpose dbhat_dR so that it has the right shape
     grad_bhat = np.zeros([numberOfDataPoints, 3, 3])
     grad_bhat[:, 0, :] = dbhat_dR
@@ -137,22 +197,18 @@ def immediate_analysis(
     # H_Booker: H is the determinant of the dispersion tensor D. Booker quartic
     # H_Cardano: H is the zero eigenvalue of the dispersion tensor D. Can be calculated with Cardano's formula.
 
-    H_Booker = hamiltonian(q_R.data, q_Z.data, K_R.data, K_zeta_initial, K_Z.data)
-    # Create and immediately evaluate a Hamiltonian with the opposite mode
-    # That is, the opposite of the discriminant in the Booker quartic
-    H_Booker_other = Hamiltonian(
-        field,
-        launch_angular_frequency,
-        -mode_flag,
-        find_density_1D,
-        delta_R,
-        delta_Z,
-        delta_K_R,
-        delta_K_zeta,
-        delta_K_Z,
-    )(q_R.data, q_Z.data, K_R.data, K_zeta_initial, K_Z.data)
-
-    electron_density = np.asfarray(find_density_1D(poloidal_flux))
+    # H_Booker_other uses the opposite sign of the discriminant in the
+    # Booker quartic, and shares everything else with H_Booker
+    if debug:
+        H_Booker, H_Booker_other = hamiltonian.both_modes(
+            q_R.data, q_Z.data, K_R.data, K_zeta_initial, K_Z.data
+        )
+    else:
+        H_Booker = hamiltonian(q_R.data, q_Z.data, K_R.data, K_zeta_initial, K_Z.data)
+
+    electron_density = np.ascontiguousarray(
+        find_density_1D(poloidal_flux), dtype=np.float64
+    )
     temperature = find_temperature_1D(poloidal_flux) if find_temperature_1D else None
 
     epsilon = DielectricTensor(
@@ -171,7 +227,8 @@ def immediate_analysis(
     # Sanity check. Makes sure that calculated quantities are reasonable
     # -------------------
     check_output(H_Booker)
-    print("The final value of H_Booker is", H_Booker[-1])
+    if debug:
+        print("The final value of H_Booker is", H_Booker[-1])
     ##
 
     df = xr.Dataset(
@@ -207,7 +264,6 @@ def immediate_analysis(
             "g_magnitude": g_magnitude,
             "grad_bhat": (["tau", "row", "col"], grad_bhat),
             "H_Booker": (["tau"], H_Booker),
-            "H_Booker_other": (["tau"], H_Booker_other),
             "normalised_plasma_freqs": (["tau"], normalised_plasma_freqs),
             "normalised_gyro_freqs": (["tau"], normalised_gyro_freqs),
             "x_hat": (["tau", "col"], x_hat),
@@ -230,6 +286,9 @@ def immediate_analysis(
     if temperature is not None:
         df.update({"temperature": (["tau"], temperature)})
 
+    if debug:
+        df.update({"H_Booker_other": (["tau"], H_Booker_other)})
+
     if vacuumLaunch_flag:
         vacuum_only = {
             "Psi_3D_lab_entry": (["row", "col"], Psi_3D_lab_entry),
@@ -249,58 +308,97 @@ def further_analysis(
     field: MagneticField,
     detailed_analysis_flag: bool,
     dH: Dict[str, ArrayLike],
+    debug: bool = False,
 ):
+    """Compute the localisation and other derived quantities along the beam
+
+    If ``debug`` is true, print a summary of the mismatch at the cut-off.
+    """
+    # Bind plain ndarrays once, so the numerics below don't pay for
+    # xarray alignment on every operation
+    tau = df.tau.values
+    q_R = df.q_R.values
+    q_zeta = df.q_zeta.values
+    q_Z = df.q_Z.values
+    K_R = df.K_R.values
+    K_zeta_initial = df.K_zeta_initial.values
+    K_Z = df.K_Z.values
+    b_hat = df.b_hat.values
+    x_hat = df.x_hat.values
+    y_hat = df.y_hat.values
+    g_hat = df.g_hat.values
+    g_magnitude = df.g_magnitude.values
+    grad_bhat = df.grad_bhat.values
+    dH_dKzeta = df.dH_dKzeta.values
+    epsilon_para = df.epsilon_para.values
+    epsilon_perp = df.epsilon_perp.values
+    epsilon_g = df.epsilon_g.values
+    electron_density = df.electron_density.values
+    launch_angular_frequency = inputs.launch_angular_frequency.values
+
     # Calculates various useful stuff
-    q_X, q_Y, _ = cylindrical_to_cartesian(df.q_R, df.q_zeta, df.q_Z)
-    point_spacing = np.sqrt(
-        np.diff(q_X) ** 2 + np.diff(q_Y) ** 2 + np.diff(df.q_Z) ** 2
+    q_X, q_Y, _ = cylindrical_to_cartesian(q_R, q_zeta, q_Z)
+    numberOfDataPoints = len(tau)
+    dR_sq = np.diff(q_R) ** 2
+    dZ_sq = np.diff(q_Z) ** 2
+    distance_along_line = np.zeros(numberOfDataPoints)
+    np.cumsum(
+        np.sqrt(np.diff(q_X) ** 2 + np.diff(q_Y) ** 2 + dZ_sq),
+        out=distance_along_line[1:],
     )
-    distance_along_line = np.append(0, np.cumsum(point_spacing))
 
     # Calculates the index of the minimum magnitude of K
     # That is, finds when the beam hits the cut-off
-    K_magnitude_array = np.asfarray(
-        K_magnitude(df.K_R, df.K_zeta_initial, df.K_Z, df.q_R)
-    )
+    K_magnitude_array = K_magnitude(K_R, K_zeta_initial, K_Z, q_R)
 
     # Index of the cutoff, at the minimum value of K, use this with other arrays
-    cutoff_index = find_nearest(np.abs(K_magnitude_array), 0)
+    cutoff_index = int(np.argmin(K_magnitude_array))
 
     # Calcuating the angles theta and theta_m
     # B \cdot K / (abs (B) abs(K))
     sin_theta_m_analysis = (
-        df.b_hat.sel(col="R") * df.K_R
-        + df.b_hat.sel(col="zeta") * df.K_zeta_initial / df.q_R
-        + df.b_hat.sel(col="Z") * df.K_Z
+        b_hat[:, 0] * K_R + b_hat[:, 1] * K_zeta_initial / q_R + b_hat[:, 2] * K_Z
     ) / K_magnitude_array
 
     # Assumes the mismatch angle is never smaller than -90deg or bigger than 90deg
-    theta_m = np.sign(sin_theta_m_analysis) * np.arcsin(abs(sin_theta_m_analysis))
+    theta_m = np.arcsin(sin_theta_m_analysis)
 
-    kperp1_hat = make_unit_vector_from_cross_product(df.y_hat, df.b_hat)
+    kperp1_hat = make_unit_vector_from_cross_product(y_hat, b_hat)
     # The negative sign is there by definition
-    sin_theta_analysis = -dot(df.x_hat, kperp1_hat)
+    sin_theta_analysis = -dot(x_hat, kperp1_hat)
     # The negative sign is there by definition. Alternative way to get sin_theta
     # Assumes theta is never smaller than -90deg or bigger than 90deg
-    theta = np.sign(sin_theta_analysis) * np.arcsin(abs(sin_theta_analysis))
+    theta = np.arcsin(sin_theta_analysis)
 
-    cos_theta_analysis = np.cos(theta)
+    # Both angles are in [-90deg, 90deg], so their cosines are non-negative
+    cos_theta_m_analysis = np.sqrt(1 - sin_theta_m_analysis**2)
+    cos_theta_analysis = np.sqrt(1 - sin_theta_analysis**2)
     # -----
 
     # Calcuating the corrections to make M from Psi
     # Includes terms small in mismatch
 
     # The dominant value of kperp1 that is backscattered at every point
-    k_perp_1_bs = -2 * K_magnitude_array * np.cos(theta_m + theta) / cos_theta_analysis
+    # cos(theta_m + theta) = cos(theta_m) cos(theta) - sin(theta_m) sin(theta)
+    k_perp_1_bs = (
+        -2
+        * K_magnitude_array
+        * (
+            cos_theta_m_analysis * cos_theta_analysis
+            - sin_theta_m_analysis * sin_theta_analysis
+        )
+        / cos_theta_analysis
+    )
 
+    dpolflux_dR = df.dpolflux_dR.values
     normal_vectors = np.vstack(
-        (df.dpolflux_dR, np.zeros_like(df.dpolflux_dR), df.dpolflux_dZ)
+        (dpolflux_dR, np.zeros_like(dpolflux_dR), df.dpolflux_dZ.values)
     ).T
     normal_magnitudes = np.linalg.norm(normal_vectors, axis=-1)
     normal_hat = normal_vectors / normal_magnitudes[:, np.newaxis]
     binormal_hat = make_unit_vector_from_cross_product(
-        df.b_hat, normal_hat
-    )  # by definition, binormal vector = tangent vector cross normal vector. Follows the same sign convention as Pyrokinetics [Patel, Bhavin, et al. "Pyrokinetics-A Python library to standardise gyrokinetic analysis." Journal of open source software (2024)]
+        b_hat, normal_hat
+    )  # by definition, binormal vector = tangent vector cross normal vector. Follows the same sign convention as Pyrokinetics [Patel, Bhavin, et al. "Pyrokinetics-A Python library to standardise gyrokinetic analysis." Journal of open source software (2024)]
 
     k_perp_1_bs_normal = k_perp_1_bs * dot(
         kperp1_hat, normal_hat
@@ -310,29 +408,39 @@ def further_analysis(
     )  # TODO: Check that this works properly
 
     # Converting x_hat, y_hat, and Psi_3D to Cartesians so we can contract them with each other
-    cos_q_zeta = np.cos(df.q_zeta)
-    sin_q_zeta = np.sin(df.q_zeta)
+    cos_q_zeta = np.cos(q_zeta)
+    sin_q_zeta = np.sin(q_zeta)
 
     def to_Cartesian(array):
-        cart = np.empty([len(df.tau), 3])
-        cart[:, 0] = array[:, 0] * cos_q_zeta - array[:, 1] * sin_q_zeta
-        cart[:, 1] = array[:, 0] * sin_q_zeta + array[:, 1] * cos_q_zeta
-        cart[:, 2] = array[:, 2]
-        return cart
+        # Works on any stack of (..., N, 3) vectors at once
+        return np.stack(
+            [
+                array[..., 0] * cos_q_zeta - array[..., 1] * sin_q_zeta,
+                array[..., 0] * sin_q_zeta + array[..., 1] * cos_q_zeta,
+                array[..., 2],
+            ],
+            axis=-1,
+        )
 
-    y_hat_Cartesian = to_Cartesian(df.y_hat)
-    x_hat_Cartesian = to_Cartesian(df.x_hat)
-    g_hat_Cartesian = to_Cartesian(df.g_hat)
+    # The beam basis vectors stacked together, shape (3, N, 3)
+    hats = np.stack([x_hat, y_hat, g_hat])
+    x_hat_Cartesian, y_hat_Cartesian, g_hat_Cartesian = to_Cartesian(hats)
 
     Psi_3D_Cartesian = find_Psi_3D_lab_Cartesian(
-        df.Psi_3D, df.q_R, df.q_zeta, df.K_R, df.K_zeta_initial
+        df.Psi_3D.values, q_R, q_zeta, K_R, K_zeta_initial
+    )
+    # Contract Psi with every pair of basis vectors in a single pass
+    hats_Cartesian = np.stack([x_hat_Cartesian, y_hat_Cartesian, g_hat_Cartesian])
+    Psi_hats = np.einsum(
+        "ani,nij,bnj->abn",
+        hats_Cartesian,
+        Psi_3D_Cartesian,
+        hats_Cartesian,
+        optimize="greedy",
     )
-    Psi_xx = dot(x_hat_Cartesian, dot(Psi_3D_Cartesian, x_hat_Cartesian))
-    Psi_xy = dot(x_hat_Cartesian, dot(Psi_3D_Cartesian, y_hat_Cartesian))
-    Psi_yy = dot(y_hat_Cartesian, dot(Psi_3D_Cartesian, y_hat_Cartesian))
-    Psi_xg = dot(x_hat_Cartesian, dot(Psi_3D_Cartesian, g_hat_Cartesian))
-    Psi_yg = dot(y_hat_Cartesian, dot(Psi_3D_Cartesian, g_hat_Cartesian))
-    Psi_gg = dot(g_hat_Cartesian, dot(Psi_3D_Cartesian, g_hat_Cartesian))
+    Psi_xx, Psi_xy, Psi_xg = Psi_hats[0]
+    Psi_yy, Psi_yg = Psi_hats[1, 1:]
+    Psi_gg = Psi_hats[2, 2]
 
     Psi_xx_entry = np.dot(
         x_hat_Cartesian[0, :],
@@ -347,44 +455,63 @@ def further_analysis(
         np.dot(Psi_3D_lab_entry_cartersian, y_hat_Cartesian[0, :]),
     )
 
-    numberOfDataPoints = len(df.tau)
     # Calculating intermediate terms that are needed for the corrections in M
-    xhat_dot_grad_bhat = dot(df.x_hat, df.grad_bhat)
-    yhat_dot_grad_bhat = dot(df.y_hat, df.grad_bhat)
+    (
+        (
+            xhat_dot_grad_bhat_dot_xhat,
+            xhat_dot_grad_bhat_dot_yhat,
+            xhat_dot_grad_bhat_dot_ghat,
+        ),
+        (
+            yhat_dot_grad_bhat_dot_xhat,
+            yhat_dot_grad_bhat_dot_yhat,
+            yhat_dot_grad_bhat_dot_ghat,
+        ),
+    ) = np.einsum(
+        "ani,nij,bnj->abn",
+        hats[:2],
+        grad_bhat,
+        hats,
+        optimize="greedy",
+    )
+
+    # All the derivatives along tau we need, taken in a single pass
+    d_g_hat_d_tau, d_x_hat_d_tau, d_theta_d_tau = np.split(
+        np.gradient(np.vstack([g_hat.T, x_hat.T, theta]), tau, axis=1), [3, 6]
+    )
+    d_theta_d_tau = d_theta_d_tau[0]
 
     # See notes 07 June 2021
-    grad_g_hat = df.g_hat.differentiate("tau")
     ray_curvature_kappa = (
-        np.block(
+        np.stack(
             [
-                [grad_g_hat.sel(col="R") - df.g_hat.sel(col="zeta") * df.dH_dKzeta],
-                [grad_g_hat.sel(col="zeta") + df.g_hat.sel(col="R") * df.dH_dKzeta],
-                [grad_g_hat.sel(col="Z")],
-            ]
+                d_g_hat_d_tau[0] - g_hat[:, 1] * dH_dKzeta,
+                d_g_hat_d_tau[1] + g_hat[:, 0] * dH_dKzeta,
+                d_g_hat_d_tau[2],
+            ],
+            axis=-1,
         )
-        / df.g_magnitude.data
-    ).T
+        / g_magnitude[:, np.newaxis]
+    )
 
-    grad_x_hat = df.x_hat.differentiate("tau")
-    d_xhat_d_tau = np.block(
+    d_xhat_d_tau = np.stack(
         [
-            [grad_x_hat.sel(col="R") - df.x_hat.sel(col="zeta") * df.dH_dKzeta],
-            [grad_x_hat.sel(col="zeta") + df.x_hat.sel(col="R") * df.dH_dKzeta],
-            [grad_x_hat.sel(col="Z")],
-        ]
-    ).T
+            d_x_hat_d_tau[0] - x_hat[:, 1] * dH_dKzeta,
+            d_x_hat_d_tau[1] + x_hat[:, 0] * dH_dKzeta,
+            d_x_hat_d_tau[2],
+        ],
+        axis=-1,
+    )
 
-    xhat_dot_grad_bhat_dot_xhat = dot(xhat_dot_grad_bhat, df.x_hat)
-    xhat_dot_grad_bhat_dot_yhat = dot(xhat_dot_grad_bhat, df.y_hat)
-    xhat_dot_grad_bhat_dot_ghat = dot(xhat_dot_grad_bhat, df.g_hat)
-    yhat_dot_grad_bhat_dot_xhat = dot(yhat_dot_grad_bhat, df.x_hat)
-    yhat_dot_grad_bhat_dot_yhat = dot(yhat_dot_grad_bhat, df.y_hat)
-    yhat_dot_grad_bhat_dot_ghat = dot(yhat_dot_grad_bhat, df.g_hat)
-    kappa_dot_xhat = dot(ray_curvature_kappa, df.x_hat)
-    kappa_dot_yhat = dot(ray_curvature_kappa, df.y_hat)
-    # This should be 0. Good to check.
-    kappa_dot_ghat = dot(ray_curvature_kappa, df.g_hat)
-    d_xhat_d_tau_dot_yhat = dot(d_xhat_d_tau, df.y_hat)
+    # Project kappa onto all three basis vectors in one pass.
+    # kappa_dot_ghat should be 0. Good to check.
+    kappa_dot_xhat, kappa_dot_yhat, kappa_dot_ghat = np.einsum(
+        "nj,anj->an", ray_curvature_kappa, hats
+    )
+    kappa_magnitude = np.sqrt(
+        np.einsum("nj,nj->n", ray_curvature_kappa, ray_curvature_kappa)
+    )
+    d_xhat_d_tau_dot_yhat = dot(d_xhat_d_tau, y_hat)
 
     # Calculates the components of M_w, only taking into consideration
     # correction terms that are not small in mismatch
@@ -395,25 +522,29 @@ def further_analysis(
 
     # Calculates the localisation, wavenumber resolution, and mismatch attenuation pieces
     det_M_w_analysis = M_xx * M_yy - M_xy**2
-    M_w_inv_xx = M_yy / det_M_w_analysis
-    M_w_inv_xy = -M_xy / det_M_w_analysis
-    M_w_inv_yy = M_xx / det_M_w_analysis
-
-    delta_k_perp_2 = 2 * np.sqrt(-1 / np.imag(M_w_inv_yy))
+    inverse_det_M_w = 1 / det_M_w_analysis
+    M_w_inv_xx = M_yy * inverse_det_M_w
+    M_w_inv_xy = -M_xy * inverse_det_M_w
+    M_w_inv_yy = M_xx * inverse_det_M_w
+
+    # Each of these is needed more than once below
+    imag_M_w_inv_xx = M_w_inv_xx.imag
+    imag_M_w_inv_xy = M_w_inv_xy.imag
+    imag_M_w_inv_yy = M_w_inv_yy.imag
+    sqrt_minus_imag_M_w_inv_yy = np.sqrt(-imag_M_w_inv_yy)
+
+    delta_k_perp_2 = 2 / sqrt_minus_imag_M_w_inv_yy
     delta_theta_m = np.sqrt(
-        np.imag(M_w_inv_yy)
-        / ((np.imag(M_w_inv_xy)) ** 2 - np.imag(M_w_inv_xx) * np.imag(M_w_inv_yy))
+        imag_M_w_inv_yy / (imag_M_w_inv_xy**2 - imag_M_w_inv_xx * imag_M_w_inv_yy)
     ) / (K_magnitude_array)
     loc_m = np.exp(-2 * (theta_m / delta_theta_m) ** 2)
 
-    print("polflux: ", df.poloidal_flux[cutoff_index].data)
+    if debug:
+        print("polflux: ", df.poloidal_flux.values[cutoff_index])
 
-    print("theta_m: ", theta_m[cutoff_index].data)
-    print("delta_theta_m: ", delta_theta_m[cutoff_index].data)
-    print(
-        "mismatch attenuation: ",
-        (np.exp(-2 * (theta_m[cutoff_index] / delta_theta_m[cutoff_index]) ** 2)).data,
-    )
+        print("theta_m: ", theta_m[cutoff_index])
+        print("delta_theta_m: ", delta_theta_m[cutoff_index])
+        print("mismatch attenuation: ", loc_m[cutoff_index])
 
     # This part is used to make some nice plots when post-processing
     R_midplane_points = np.linspace(field.R_coord[0], field.R_coord[-1], 1000)
@@ -425,44 +556,39 @@ def further_analysis(
 
     H_1_Cardano, H_2_Cardano, H_3_Cardano = find_H_Cardano(
         K_magnitude_array,
-        inputs.launch_angular_frequency.data,
-        df.epsilon_para.data,
-        df.epsilon_perp.data,
-        df.epsilon_g.data,
-        theta_m.data,
-    )
-
-    def H_cardano(K_R, K_zeta, K_Z):
-        # In my experience, the H_3_Cardano expression corresponds to
-        # the O mode, and the H_2_Cardano expression corresponds to
-        # the X-mode.
-
-        # ALERT: This may not always be the case! Check the output
-        # figure to make sure that the appropriate solution is indeed
-        # 0 along the ray
-        result = find_H_Cardano(
-            K_magnitude(K_R, K_zeta, K_Z, df.q_R),
-            inputs.launch_angular_frequency,
-            df.epsilon_para,
-            df.epsilon_perp,
-            df.epsilon_g,
-            theta_m,
-        )
-        if inputs.mode_flag == 1:
-            return result[2]
-        return result[1]
-
-    def grad_H_Cardano(direction: str, spacing: float):
-        return derivative(
-            H_cardano,
-            direction,
-            args={"K_R": df.K_R, "K_zeta": df.K_zeta_initial, "K_Z": df.K_Z},
-            spacings=spacing,
-        )
+        launch_angular_frequency,
+        epsilon_para,
+        epsilon_perp,
+        epsilon_g,
+        theta_m,
+    )
 
-    g_R_Cardano = grad_H_Cardano("K_R", inputs.delta_K_R)
-    g_zeta_Cardano = grad_H_Cardano("K_zeta", inputs.delta_K_zeta)
-    g_Z_Cardano = grad_H_Cardano("K_Z", inputs.delta_K_Z)
+    # In my experience, the H_3_Cardano expression corresponds to
+    # the O mode, and the H_2_Cardano expression corresponds to
+    # the X-mode.
+
+    # ALERT: This may not always be the case! Check the output
+    # figure to make sure that the appropriate solution is indeed
+    # 0 along the ray
+    cardano_index = 2 if inputs.mode_flag == 1 else 1
+
+    # |K| has the same units as K_R and K_Z, so step it by the finer of
+    # their two spacings. delta_K_zeta is a step in K_zeta = q_R K_phi,
+    # which is not a fixed step in |K|
+    g_R_Cardano, g_zeta_Cardano, g_Z_Cardano = grad_H_Cardano(
+        K_R,
+        K_zeta_initial,
+        K_Z,
+        q_R,
+        K_magnitude_array,
+        launch_angular_frequency,
+        epsilon_para,
+        epsilon_perp,
+        epsilon_g,
+        theta_m,
+        cardano_index,
+        delta_K=min(abs(inputs.delta_K_R.values), abs(inputs.delta_K_Z.values)),
+    )
     # This has maximum imaginary component of like 1e-16 -- should just be real?
     g_magnitude_Cardano = np.sqrt(g_R_Cardano**2 + g_zeta_Cardano**2 + g_Z_Cardano**2)
 
@@ -480,37 +606,35 @@ def further_analysis(
 
     # localisation_ray = g_magnitude_Cardano[0]**2/g_magnitude_Cardano**2
     # The first point of the beam may be very slightly in the plasma, so I have used the vacuum expression for the group velocity instead
-    loc_r = (
-        2 * constants.c / inputs.launch_angular_frequency
-    ) ** 2 / g_magnitude_Cardano**2
+    loc_r = (2 * constants.c / launch_angular_frequency) ** 2 / g_magnitude_Cardano**2
 
     # Spectrum piece of localisation as a function of distance along ray
     spectrum_power_law_coefficient = 13 / 3  # Turbulence cascade
-    wavenumber_K0 = angular_frequency_to_wavenumber(
-        inputs.launch_angular_frequency.data
-    )
+    wavenumber_K0 = angular_frequency_to_wavenumber(launch_angular_frequency)
     loc_s = (k_perp_1_bs / (-2 * wavenumber_K0)) ** (-spectrum_power_law_coefficient)
 
     # Beam piece of localisation as a function of distance along ray
     # Determinant of the imaginary part of Psi_w
-    det_imag_Psi_w_analysis = np.imag(Psi_xx) * np.imag(Psi_yy) - np.imag(Psi_xy) ** 2
+    det_imag_Psi_w_analysis = Psi_xx.imag * Psi_yy.imag - Psi_xy.imag**2
 
     # Assumes circular beam at launch
     beam_waist_y = find_waist(
-        inputs.launch_beam_width.data, wavenumber_K0, inputs.launch_beam_curvature.data
+        inputs.launch_beam_width.values,
+        wavenumber_K0,
+        inputs.launch_beam_curvature.values,
     )
 
     loc_b = (
         (beam_waist_y / np.sqrt(2))
         * det_imag_Psi_w_analysis
-        / (np.abs(det_M_w_analysis) * np.sqrt(-np.imag(M_w_inv_yy)))
+        / (np.abs(det_M_w_analysis) * sqrt_minus_imag_M_w_inv_yy)
     )
     # --
 
     # Polarisation piece of localisation as a function of distance along ray
     H_eigvals, e_eigvecs = dispersion_eigenvalues(
         K_magnitude_array,
-        inputs.launch_angular_frequency.data,
+        launch_angular_frequency,
         df,
         numberOfDataPoints,
         theta_m,
@@ -522,15 +646,17 @@ def further_analysis(
     e_hat = e_eigvecs[:, :, mode_index]
 
     # equilibrium dielectric tensor - identity matrix. \bm{\epsilon}_{eq} - \bm{1}
-    zero = np.zeros(len(df.tau))
+    zero = np.zeros(numberOfDataPoints)
+    epsilon_perp_minus_1 = epsilon_perp - 1
     # fmt: off
-    epsilon_minus_identity = np.block(
+    epsilon_minus_identity = np.stack(
         [
-            [[df.epsilon_perp],    [1j * df.epsilon_g], [zero]],
-            [[-1j * df.epsilon_g], [df.epsilon_perp],   [zero]],
-            [[zero],               [zero],              [df.epsilon_para]],
-        ]
-    ).T - np.eye(3)
+            epsilon_perp_minus_1, -1j * epsilon_g,      zero,
+            1j * epsilon_g,       epsilon_perp_minus_1, zero,
+            zero,                 zero,                 epsilon_para - 1,
+        ],
+        axis=-1,
+    ).reshape(numberOfDataPoints, 3, 3)
     # fmt: on
 
     # Avoids dividing a small number by another small number, leading to a big number because of numerical errors or something
@@ -542,14 +668,15 @@ def further_analysis(
             )
         )
         ** 2,
-        (df.electron_density * 1e19) ** 2,
-        out=np.zeros_like(df.electron_density),
-        where=(df.electron_density > 1e-6).data,
+        (electron_density * 1e19) ** 2,
+        out=np.zeros_like(electron_density),
+        where=(electron_density > 1e-6),
     )
+    temperature = df.temperature.values if "temperature" in df else None
     loc_p = (
-        inputs.launch_angular_frequency**2
+        launch_angular_frequency**2
         * constants.epsilon_0
-        * find_electron_mass(df.get("temperature"))
+        * find_electron_mass(temperature)
         / constants.e**2
     ) ** 2 * loc_p_unnormalised
     # Note that loc_p is called varepsilon in my paper
@@ -580,12 +707,12 @@ def further_analysis(
         "x_hat_Cartesian": (["tau", "col_cart"], x_hat_Cartesian),
         "y_hat_Cartesian": (["tau", "col_cart"], y_hat_Cartesian),
         "g_hat_Cartesian": (["tau", "col_cart"], g_hat_Cartesian),
-        "M_xx": M_xx,
-        "M_xy": M_xy,
-        "M_yy": M_yy,
-        "M_w_inv_xx": M_w_inv_xx,
-        "M_w_inv_xy": M_w_inv_xy,
-        "M_w_inv_yy": M_w_inv_yy,
+        "M_xx": (["tau"], M_xx),
+        "M_xy": (["tau"], M_xy),
+        "M_yy": (["tau"], M_yy),
+        "M_w_inv_xx": (["tau"], M_w_inv_xx),
+        "M_w_inv_xy": (["tau"], M_w_inv_xy),
+        "M_w_inv_yy": (["tau"], M_w_inv_yy),
         "xhat_dot_grad_bhat_dot_xhat": (["tau"], xhat_dot_grad_bhat_dot_xhat),
         "xhat_dot_grad_bhat_dot_yhat": (["tau"], xhat_dot_grad_bhat_dot_yhat),
         "xhat_dot_grad_bhat_dot_ghat": (["tau"], xhat_dot_grad_bhat_dot_ghat),
@@ -595,18 +722,18 @@ def further_analysis(
         "grad_grad_H": (["tau", "row", "col"], grad_grad_H),
         "gradK_grad_H": (["tau", "row", "col"], gradK_grad_H),
         "gradK_gradK_H": (["tau", "row", "col"], gradK_gradK_H),
-        "d_theta_d_tau": (["tau"], np.gradient(theta, df.tau)),
+        "d_theta_d_tau": (["tau"], d_theta_d_tau),
         "d_xhat_d_tau_dot_yhat": (["tau"], d_xhat_d_tau_dot_yhat),
         "kappa_dot_xhat": (["tau"], kappa_dot_xhat),
         "kappa_dot_yhat": (["tau"], kappa_dot_yhat),
         "kappa_dot_ghat": (["tau"], kappa_dot_ghat),
-        "kappa_magnitude": (["tau"], np.linalg.norm(ray_curvature_kappa, axis=-1)),
-        "delta_k_perp_2": delta_k_perp_2,
-        "delta_theta_m": delta_theta_m,
-        "theta_m": theta_m,
-        "k_perp_1_bs": k_perp_1_bs,
-        "k_perp_1_bs_normal": k_perp_1_bs_normal,
-        "k_perp_1_bs_binormal": k_perp_1_bs_binormal,
+        "kappa_magnitude": (["tau"], kappa_magnitude),
+        "delta_k_perp_2": (["tau"], delta_k_perp_2),
+        "delta_theta_m": (["tau"], delta_theta_m),
+        "theta_m": (["tau"], theta_m),
+        "k_perp_1_bs": (["tau"], k_perp_1_bs),
+        "k_perp_1_bs_normal": (["tau"], k_perp_1_bs_normal),
+        "k_perp_1_bs_binormal": (["tau"], k_perp_1_bs_binormal),
         "K_magnitude": (["tau"], K_magnitude_array),
         "cutoff_index": cutoff_index,
         "x_hat": df.x_hat,
@@ -624,20 +751,20 @@ def further_analysis(
         "H_3_Cardano": (["tau"], H_3_Cardano),
         "kperp1_hat": (["tau", "col"], kperp1_hat),
         "theta": (["tau"], theta),
-        "g_magnitude_Cardano": g_magnitude_Cardano,
+        "g_magnitude_Cardano": (["tau"], g_magnitude_Cardano),
         "poloidal_flux_on_midplane": (["R_midplane"], poloidal_flux_on_midplane),
-        "loc_b": loc_b,
-        "loc_p": loc_p,
-        "loc_r": loc_r,
-        "loc_s": loc_s,
-        "loc_m": loc_m,
-        "loc_b_r_s": loc_b_r_s,
-        "loc_b_r": loc_b_r,
-        "beam_cartesian": (["tau", "col_cart"], np.vstack([q_X, q_Y, df.q_Z.data]).T),
+        "loc_b": (["tau"], loc_b),
+        "loc_p": (["tau"], loc_p),
+        "loc_r": (["tau"], loc_r),
+        "loc_s": (["tau"], loc_s),
+        "loc_m": (["tau"], loc_m),
+        "loc_b_r_s": (["tau"], loc_b_r_s),
+        "loc_b_r": (["tau"], loc_b_r),
+        "beam_cartesian": (["tau", "col_cart"], np.vstack([q_X, q_Y, q_Z]).T),
     }
 
-    RZ_point_spacing = np.sqrt((np.diff(df.q_Z)) ** 2 + (np.diff(df.q_R)) ** 2)
-    RZ_distance_along_line = np.append(0, np.cumsum(RZ_point_spacing))
+    RZ_distance_along_line = np.zeros(numberOfDataPoints)
+    np.cumsum(np.sqrt(dZ_sq + dR_sq), out=RZ_distance_along_line[1:])
 
     df = df.assign_coords(
         {
@@ -651,16 +778,18 @@ def further_analysis(
             "distance_along_line": (["tau"], distance_along_line, {"units": "m"}),
             "row_cart": CARTESIAN_VECTOR_COMPONENTS,
             "col_cart": CARTESIAN_VECTOR_COMPONENTS,
-            "q_X": q_X,
-            "q_Y": q_Y,
+            "q_X": (["tau"], q_X),
+            "q_Y": (["tau"], q_Y),
         }
     )
     set_vector_components_long_name(df)
     df.update(further_df)
 
-    if detailed_analysis_flag and (cutoff_index + 1 != len(df.tau)):
+    if detailed_analysis_flag and (cutoff_index + 1 != numberOfDataPoints):
         df.update(localisation_analysis(df, cutoff_index, wavenumber_K0))
 
+    downcast_diagnostics(df)
+
     return df
 
 
@@ -687,23 +816,47 @@ def dispersion_eigenvalues(
     D_11, D_22, D_bb, D_12, D_1b = find_D(
         K_magnitude_array,
         launch_angular_frequency,
-        df.epsilon_para,
-        df.epsilon_perp,
-        df.epsilon_g,
+        df.epsilon_para.values,
+        df.epsilon_perp.values,
+        df.epsilon_g.values,
         theta_m,
     )
 
     # Dispersion tensor
-    D_tensor = np.zeros([numberOfDataPoints, 3, 3], dtype="complex128")
-    D_tensor[:, 0, 0] = D_11
-    D_tensor[:, 1, 1] = D_22
-    D_tensor[:, 2, 2] = D_bb
-    D_tensor[:, 0, 1] = -1j * D_12
-    D_tensor[:, 1, 0] = 1j * D_12
-    D_tensor[:, 0, 2] = D_1b
-    D_tensor[:, 2, 0] = D_1b
+    zero = np.zeros(numberOfDataPoints)
+
+    if np.iscomplexobj(D_11) or np.iscomplexobj(D_12) or np.iscomplexobj(D_1b):
+        # fmt: off
+        D_tensor = np.stack(
+            [
+                D_11,        -1j * D_12, D_1b,
+                1j * D_12,   D_22,       zero,
+                D_1b,        zero,       D_bb,
+            ],
+            axis=-1,
+        ).reshape(numberOfDataPoints, 3, 3)
+        # fmt: on
+        return np.linalg.eigh(D_tensor)
+
+    # When the components are real, the only complex entries of D are the
+    # -i D_12 and i D_12 couplings. Conjugating by U = diag(1, i, 1) turns D
+    # into a real symmetric matrix with the same eigenvalues, which is
+    # cheaper to diagonalise, and whose eigenvectors v give those of D as U v
+    # fmt: off
+    D_tensor_real = np.stack(
+        [
+            D_11, D_12, D_1b,
+            D_12, D_22, zero,
+            D_1b, zero, D_bb,
+        ],
+        axis=-1,
+    ).reshape(numberOfDataPoints, 3, 3)
+    # fmt: on
+    eigenvalues, eigenvectors_real = np.linalg.eigh(D_tensor_real)
 
-    return np.linalg.eigh(D_tensor)
+    eigenvectors = eigenvectors_real.astype(np.complex128)
+    eigenvectors[:, 1, :] *= 1j
+    return eigenvalues, eigenvectors
 
 
 def find_e2_width(
@@ -724,6 +877,10 @@ def find_e2_width(
     """
 
     max_over_e2 = (array.max() / (np.e**2)).data
+    l_lc = l_lc.values
+    array = array.values
+    k_perp = k_perp.values
+
     delta_l_1 = find_x0(l_lc[:cutoff_index], array[:cutoff_index], max_over_e2)
     delta_l_2 = find_x0(l_lc[cutoff_index:], array[cutoff_index:], max_over_e2)
 
@@ -742,8 +899,11 @@ def find_e2_width(
 def cumulative_integrate(array: xr.DataArray) -> xr.DataArray:
     """Cumulative integral of ``array`` along ``distance_along_line``, shifted
     by half the maximum"""
-    cumint = array.cumulative_integrate("distance_along_line")
-    return cumint - cumint.max() / 2
+    cumint = integrate.cumulative_trapezoid(
+        array.values, array.distance_along_line.values, initial=0
+    )
+    cumint -= cumint.max() / 2
+    return array.copy(data=cumint)
 
 
 def max_l_lc(
@@ -756,15 +916,82 @@ def max_l_lc(
 def mean_l_lc(
     distance_along_line: xr.DataArray, array: xr.DataArray, cutoff_index: int
 ) -> xr.DataArray:
-    return (
-        (array * distance_along_line).integrate("distance_along_line")
-        / array.integrate("distance_along_line")
-    ) - distance_along_line[cutoff_index]
+    numerator, denominator = _trapz_weighted(array.values, distance_along_line.values)
+    return numerator / denominator - distance_along_line[cutoff_index]
 
 
 def mean_kperp(k_perp: xr.DataArray, array: xr.DataArray) -> xr.DataArray:
     """Mean kperp1 for backscattering"""
-    return np.trapz(array * k_perp, k_perp) / np.trapz(array, k_perp)
+    numerator, denominator = _trapz_weighted(array.values, k_perp.values)
+    return numerator / denominator
+
+
+def _trapz_weighted(array: FloatArray, x: FloatArray) -> FloatArray:
+    """Trapezoidal integrals of ``x * array`` and ``array`` over ``x``,
+    taken together in a single pass"""
+    return integrate.trapezoid(np.stack([array * x, array]), x, axis=-1)
+
+
+def grad_H_Cardano(
+    K_R: FloatArray,
+    K_zeta: float,
+    K_Z: FloatArray,
+    q_R: FloatArray,
+    K_magnitude: FloatArray,
+    launch_angular_frequency: float,
+    epsilon_para: FloatArray,
+    epsilon_perp: FloatArray,
+    epsilon_g: FloatArray,
+    theta_m: FloatArray,
+    cardano_index: int,
+    delta_K: float,
+):
+    r"""Gradient of the ``cardano_index`` root of `find_H_Cardano` with
+    respect to ``(K_R, K_zeta, K_Z)``, with everything except K held fixed.
+
+    With :math:`\theta_m` fixed, H only depends on K through
+    :math:`|K| = \sqrt{K_R^2 + (K_\zeta / q_R)^2 + K_Z^2}`, so we take a
+    single derivative in :math:`|K|`, with step ``delta_K``, and use the
+    chain rule:
+
+    .. math::
+
+        \frac{\partial H}{\partial K_R} = \frac{dH}{d|K|} \frac{K_R}{|K|},
+        \quad
+        \frac{\partial H}{\partial K_\zeta}
+            = \frac{dH}{d|K|} \frac{K_\zeta}{q_R^2 |K|},
+        \quad
+        \frac{\partial H}{\partial K_Z} = \frac{dH}{d|K|} \frac{K_Z}{|K|}
+
+    ``K_magnitude`` must be :math:`|K|` as above, so that it isn't
+    recomputed here.
+    """
+
+    def H_cardano(K_magnitude):
+        return find_H_Cardano(
+            K_magnitude,
+            launch_angular_frequency,
+            epsilon_para,
+            epsilon_perp,
+            epsilon_g,
+            theta_m,
+        )[cardano_index]
+
+    dH_dK_over_K = (
+        derivative(
+            H_cardano,
+            "K_magnitude",
+            args={"K_magnitude": K_magnitude},
+            spacings=delta_K,
+            use_cache=False,
+        )
+        / K_magnitude
+    )
+    return (
+        dH_dK_over_K * K_R,
+        dH_dK_over_K * K_zeta / q_R**2,
+        dH_dK_over_K * K_Z,
+    )
 
 
 def localisation_analysis(df: xr.Dataset, cutoff_index: int, wavenumber_K0: float):
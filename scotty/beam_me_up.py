@@ -151,6 +151,7 @@ def beam_me_up(
     B_p_a=None,
     R_axis=None,
     minor_radius_a=None,
+    debug_flag: bool = False,
 ) -> datatree.DataTree:
     r"""Run the beam tracer
 
@@ -314,6 +315,9 @@ def beam_me_up(
         Boolean. Ensures that forward
         difference is always in negative poloidal flux gradient
         direction (into the plasma).
+    debug_flag: bool
+        If true, also compute and save ``H_Booker_other``, and print
+        extra diagnostics during the analysis
     """
 
     print("Beam trace me up, Scotty!")
@@ -597,6 +601,7 @@ def beam_me_up(
             "density_fit_method": str(density_fit_method),
             "density_fit_parameters": str(density_fit_parameters),
             "detailed_analysis_flag": detailed_analysis_flag,
+            "debug_flag": debug_flag,
             "equil_time": (equil_time),
             "figure_flag": figure_flag,
             "find_B_method": str(find_B_method),
@@ -705,6 +710,7 @@ def beam_me_up(
         output_path,
         output_filename_suffix,
         dH,
+        debug_flag,
     )
     analysis = further_analysis(
         inputs,
@@ -715,6 +721,7 @@ def beam_me_up(
         field,
         detailed_analysis_flag,
         dH,
+        debug_flag,
     )
     df.update(analysis)
     dt["analysis"] = datatree.DataTree(df)
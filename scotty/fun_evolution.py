@@ -14,6 +14,11 @@ import numpy as np
 from scotty.hamiltonian import Hamiltonian, hessians
 from scotty.typing import FloatArray, ArrayLike
 
+#: Row and column indices of the independent components of the
+#: symmetric matrix Psi, in the order they are stored in the solver
+#: state: RR, zetazeta, ZZ, Rzeta, RZ, zetaZ
+_PSI_UPPER_TRIANGLE = (np.array([0, 1, 2, 0, 0, 1]), np.array([0, 1, 2, 1, 2, 2]))
+
 
 def pack_beam_parameters(
     q_R: ArrayLike,
@@ -28,7 +33,7 @@ def pack_beam_parameters(
     # This used to be complex, with a length of 11, but the solver
     # throws a warning saying that something is casted to real It
     # seems to be fine, bu
-    beam_parameters = np.zeros(17)
+    beam_parameters = np.empty(17)
 
     beam_parameters[0] = q_R
     beam_parameters[1] = q_zeta
@@ -37,19 +42,10 @@ def pack_beam_parameters(
     beam_parameters[3] = K_R
     beam_parameters[4] = K_Z
 
-    beam_parameters[5] = np.real(Psi[0, 0])
-    beam_parameters[6] = np.real(Psi[1, 1])
-    beam_parameters[7] = np.real(Psi[2, 2])
-    beam_parameters[8] = np.real(Psi[0, 1])
-    beam_parameters[9] = np.real(Psi[0, 2])
-    beam_parameters[10] = np.real(Psi[1, 2])
-
-    beam_parameters[11] = np.imag(Psi[0, 0])
-    beam_parameters[12] = np.imag(Psi[1, 1])
-    beam_parameters[13] = np.imag(Psi[2, 2])
-    beam_parameters[14] = np.imag(Psi[0, 1])
-    beam_parameters[15] = np.imag(Psi[0, 2])
-    beam_parameters[16] = np.imag(Psi[1, 2])
+    # Gather the six independent components of Psi in one go
+    Psi_upper = np.asarray(Psi)[_PSI_UPPER_TRIANGLE]
+    beam_parameters[5:11] = Psi_upper.real
+    beam_parameters[11:17] = Psi_upper.imag
     return beam_parameters
 
 
@@ -68,23 +64,13 @@ def unpack_beam_parameters(
 
     n_points = beam_parameters.shape[1] if beam_parameters.ndim == 2 else 1
 
-    Psi_3D = np.zeros([n_points, 3, 3], dtype="complex128")
-    # Psi_RR
-    Psi_3D[:, 0, 0] = beam_parameters[5, ...] + 1j * beam_parameters[11, ...]
-    # Psi_zetazeta
-    Psi_3D[:, 1, 1] = beam_parameters[6, ...] + 1j * beam_parameters[12, ...]
-    # Psi_ZZ
-    Psi_3D[:, 2, 2] = beam_parameters[7, ...] + 1j * beam_parameters[13, ...]
-    # Psi_Rzeta
-    Psi_3D[:, 0, 1] = beam_parameters[8, ...] + 1j * beam_parameters[14, ...]
-    # Psi_RZ
-    Psi_3D[:, 0, 2] = beam_parameters[9, ...] + 1j * beam_parameters[15, ...]
-    # Psi_zetaZ
-    Psi_3D[:, 1, 2] = beam_parameters[10, ...] + 1j * beam_parameters[16, ...]
+    Psi_3D = np.empty([n_points, 3, 3], dtype="complex128")
+    # Psi_RR, Psi_zetazeta, Psi_ZZ, Psi_Rzeta, Psi_RZ, Psi_zetaZ
+    Psi_upper = (beam_parameters[5:11, ...] + 1j * beam_parameters[11:17, ...]).T
+    rows, cols = _PSI_UPPER_TRIANGLE
+    Psi_3D[:, rows, cols] = Psi_upper
     # Psi_3D is symmetric
-    Psi_3D[:, 1, 0] = Psi_3D[:, 0, 1]
-    Psi_3D[:, 2, 0] = Psi_3D[:, 0, 2]
-    Psi_3D[:, 2, 1] = Psi_3D[:, 1, 2]
+    Psi_3D[:, cols, rows] = Psi_upper
 
     return q_R, q_zeta, q_Z, K_R, K_Z, np.squeeze(Psi_3D)
 
@@ -110,7 +96,6 @@ def beam_evolution_fun(tau, beam_parameters, K_zeta, hamiltonian: Hamiltonian):
     dH = hamiltonian.derivatives(q_R, q_Z, K_R, K_zeta, K_Z, second_order=True)
 
     grad_grad_H, gradK_grad_H, gradK_gradK_H = hessians(dH)
-    grad_gradK_H = np.transpose(gradK_grad_H)
 
     dH_dR = dH["dH_dR"]
     dH_dZ = dH["dH_dZ"]
@@ -118,11 +103,14 @@ def beam_evolution_fun(tau, beam_parameters, K_zeta, hamiltonian: Hamiltonian):
     dH_dKzeta = dH["dH_dKzeta"]
     dH_dKZ = dH["dH_dKZ"]
 
+    # Since Psi is symmetric, grad_gradK_H . Psi is the transpose of
+    # Psi . gradK_grad_H, so only one of them needs computing
+    Psi_gradK_grad_H = Psi_3D @ gradK_grad_H
     d_Psi_d_tau = (
         -grad_grad_H
-        - np.matmul(Psi_3D, gradK_grad_H)
-        - np.matmul(grad_gradK_H, Psi_3D)
-        - np.matmul(np.matmul(Psi_3D, gradK_gradK_H), Psi_3D)
+        - Psi_gradK_grad_H
+        - Psi_gradK_grad_H.T
+        - Psi_3D @ gradK_gradK_H @ Psi_3D
     )
 
     return pack_beam_parameters(dH_dKR, dH_dKzeta, dH_dKZ, -dH_dR, -dH_dZ, d_Psi_d_tau)
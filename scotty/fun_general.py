@@ -73,23 +73,21 @@ def make_unit_vector_from_cross_product(vector_a, vector_b):
     Assume np.shape(vector_a) = np.shape(vector_b) = (n,3)
     or
     np.shape(vector_a) = (n,3) , np.shape(vector_b) = (3)
+    or
+    np.shape(vector_a) = np.shape(vector_b) = (3)
     """
     output_vector = np.cross(vector_a, vector_b)
-    output_vector_magnitude = np.linalg.norm(output_vector, axis=-1)
-    output_unit_vector = output_vector / np.tile(output_vector_magnitude, (3, 1)).T
+    output_vector_magnitude = np.linalg.norm(output_vector, axis=-1, keepdims=True)
+    output_unit_vector = output_vector / output_vector_magnitude
 
     return output_unit_vector
 
 
 def find_inverse_2D(matrix_2D):
-    # Finds the inverse of a 2x2 matrix
-    matrix_2D_inverse = np.zeros([2, 2], dtype="complex128")
-    determinant = matrix_2D[0, 0] * matrix_2D[1, 1] - matrix_2D[0, 1] * matrix_2D[1, 0]
-    matrix_2D_inverse[0, 0] = matrix_2D[1, 1] / determinant
-    matrix_2D_inverse[1, 1] = matrix_2D[0, 0] / determinant
-    matrix_2D_inverse[0, 1] = -matrix_2D[0, 1] / determinant
-    matrix_2D_inverse[1, 0] = -matrix_2D[1, 0] / determinant
-    return matrix_2D_inverse
+    # Finds the inverse of a 2x2 matrix, in closed form
+    a, b, c, d = matrix_2D[0, 0], matrix_2D[0, 1], matrix_2D[1, 0], matrix_2D[1, 1]
+    determinant = a * d - b * c
+    return np.array([[d, -b], [-c, a]], dtype="complex128") / determinant
 
 
 def find_x0(xs, ys, y0):
@@ -99,18 +97,10 @@ def find_x0(xs, ys, y0):
     This implementation is silly but I am impatient and want to move on to other things quickly
     """
 
-    index_guess = find_nearest(ys, y0)
+    xs = np.asarray(xs)
+    ys = np.asarray(ys)
 
-    interp_y = interpolate.interp1d(
-        xs,
-        ys,
-        kind="linear",
-        axis=-1,
-        copy=True,
-        bounds_error=False,
-        fill_value="extrapolate",
-        assume_sorted=False,
-    )
+    index_guess = find_nearest(ys, y0)
 
     if index_guess == 0:
         xs_fine = np.linspace(xs[0], xs[index_guess + 1], 101)
@@ -119,7 +109,14 @@ def find_x0(xs, ys, y0):
     else:
         xs_fine = np.linspace(xs[index_guess - 1], xs[index_guess + 1], 101)
 
-    ys_fine = interp_y(xs_fine)
+    # Linear interpolation, equivalent to `interp1d(..., assume_sorted=False)`
+    # but without building an interpolator for a single lookup. xs_fine always
+    # lies within the range of xs, so no extrapolation is needed. Most
+    # callers pass xs that are already ascending, so only sort if needed
+    if np.any(xs[1:] < xs[:-1]):
+        sort_order = np.argsort(xs, kind="stable")
+        xs, ys = xs[sort_order], ys[sort_order]
+    ys_fine = np.interp(xs_fine, xs, ys)
 
     index = find_nearest(ys_fine, y0)
     x0 = xs_fine[index]
@@ -297,6 +294,11 @@ def find_Psi_3D_lab_Cartesian(Psi_3D_lab, q_R, q_zeta, K_R, K_zeta):
     Converts Psi_3D from cylindrical to Cartesian coordinates, both in the lab frame (not the beam frame)
     The shape of Psi_3D_lab must be either [3,3] or [numberOfDataPoints,3,3]
     """
+    if Psi_3D_lab.ndim not in (2, 3):
+        raise ValueError(
+            f"Expected Psi_3D_lab to have 2 or 3 dimensions, got {Psi_3D_lab.ndim}"
+        )
+
     if Psi_3D_lab.ndim == 2:  # A single matrix of Psi
         Psi_RR = Psi_3D_lab[0, 0]
         Psi_zetazeta = Psi_3D_lab[1, 1]
@@ -316,7 +318,7 @@ def find_Psi_3D_lab_Cartesian(Psi_3D_lab, q_R, q_zeta, K_R, K_zeta):
         temp_matrix_for_Psi[1, 0] = temp_matrix_for_Psi[0, 1]
         temp_matrix_for_Psi[2, 0] = temp_matrix_for_Psi[0, 2]
         temp_matrix_for_Psi[2, 1] = temp_matrix_for_Psi[1, 2]
-    elif Psi_3D_lab.ndim == 3:  # Matrices of Psi, residing in the first index
+    else:  # Matrices of Psi, residing in the first index
         Psi_RR = Psi_3D_lab[:, 0, 0]
         Psi_zetazeta = Psi_3D_lab[:, 1, 1]
         Psi_ZZ = Psi_3D_lab[:, 2, 2]
@@ -335,8 +337,6 @@ def find_Psi_3D_lab_Cartesian(Psi_3D_lab, q_R, q_zeta, K_R, K_zeta):
         temp_matrix_for_Psi[:, 1, 0] = temp_matrix_for_Psi[:, 0, 1]
         temp_matrix_for_Psi[:, 2, 0] = temp_matrix_for_Psi[:, 0, 2]
         temp_matrix_for_Psi[:, 2, 1] = temp_matrix_for_Psi[:, 1, 2]
-    else:
-        print("Error: Psi_3D_lab has an invalid number of dimensions")
 
     rotation_matrix_xi = np.array(
         [
@@ -1268,15 +1268,15 @@ def find_D(
     # Finds the dispersion
 
     wavenumber_K0 = launch_angular_frequency / constants.c
-    n_ref_index = K_magnitude / wavenumber_K0
+    n_ref_index_sq = (K_magnitude / wavenumber_K0) ** 2
     sin_theta_m = np.sin(theta_m)
     cos_theta_m = np.cos(theta_m)
 
-    D_11_component = epsilon_perp - n_ref_index**2 * sin_theta_m**2
-    D_22_component = epsilon_perp - n_ref_index**2
-    D_bb_component = epsilon_para - n_ref_index**2 * cos_theta_m**2
+    D_11_component = epsilon_perp - n_ref_index_sq * sin_theta_m**2
+    D_22_component = epsilon_perp - n_ref_index_sq
+    D_bb_component = epsilon_para - n_ref_index_sq * cos_theta_m**2
     D_12_component = epsilon_g
-    D_1b_component = n_ref_index**2 * sin_theta_m * cos_theta_m
+    D_1b_component = n_ref_index_sq * sin_theta_m * cos_theta_m
 
     return (
         D_11_component,
@@ -1287,6 +1287,12 @@ def find_D(
     )
 
 
+# Constants appearing in the three roots given by Cardano's formula
+_CARDANO_CUBE_ROOT_2 = 2 ** (1 / 3)
+_CARDANO_ROOT_MINUS = 1 - 1j * np.sqrt(3)
+_CARDANO_ROOT_PLUS = 1 + 1j * np.sqrt(3)
+
+
 def find_H_Cardano(
     K_magnitude,
     launch_angular_frequency,
@@ -1312,29 +1318,34 @@ def find_H_Cardano(
         theta_m,
     )
 
+    D_12_sq = D_12_component**2
+    D_1b_sq = D_1b_component**2
+
     h_2_coefficient = -D_11_component - D_22_component - D_bb_component
     h_1_coefficient = (
         D_11_component * D_bb_component
         + D_11_component * D_22_component
         + D_22_component * D_bb_component
-        - D_12_component**2
-        - D_1b_component**2
+        - D_12_sq
+        - D_1b_sq
     )
     h_0_coefficient = (
-        D_22_component * D_1b_component**2
-        + D_bb_component * D_12_component**2
+        D_22_component * D_1b_sq
+        + D_bb_component * D_12_sq
         - D_11_component * D_22_component * D_bb_component
     )
 
+    h_2_sq = h_2_coefficient**2
+    h_2_cubed = h_2_sq * h_2_coefficient
     h_t_coefficient = (
-        -2 * h_2_coefficient**3
+        -2 * h_2_cubed
         + 9 * h_2_coefficient * h_1_coefficient
         - 27 * h_0_coefficient
         + 3
         * np.sqrt(3)
         * np.sqrt(
-            4 * h_2_coefficient**3 * h_0_coefficient
-            - h_2_coefficient**2 * h_1_coefficient**2
+            4 * h_2_cubed * h_0_coefficient
+            - h_2_sq * h_1_coefficient**2
             - 18 * h_2_coefficient * h_1_coefficient * h_0_coefficient
             + 4 * h_1_coefficient**3
             + 27 * h_0_coefficient**2
@@ -1342,26 +1353,19 @@ def find_H_Cardano(
         )
     ) ** (1 / 3)
 
-    H_1_Cardano = (
-        h_t_coefficient / (3 * 2 ** (1 / 3))
-        - 2 ** (1 / 3)
-        * (3 * h_1_coefficient - h_2_coefficient**2)
-        / (3 * h_t_coefficient)
-        - h_2_coefficient / 3
+    # Terms shared between the three roots
+    h_t_term = h_t_coefficient / (6 * _CARDANO_CUBE_ROOT_2)
+    h_1_term = (3 * h_1_coefficient - h_2_sq) / (
+        3 * _CARDANO_CUBE_ROOT_2**2 * h_t_coefficient
     )
+    h_2_term = h_2_coefficient / 3
+
+    H_1_Cardano = 2 * h_t_term - 2 * h_1_term - h_2_term
     H_2_Cardano = (
-        -(1 - 1j * np.sqrt(3)) / (6 * 2 ** (1 / 3)) * h_t_coefficient
-        + (1 + 1j * np.sqrt(3))
-        * (3 * h_1_coefficient - h_2_coefficient**2)
-        / (3 * 2 ** (2 / 3) * h_t_coefficient)
-        - h_2_coefficient / 3
+        -_CARDANO_ROOT_MINUS * h_t_term + _CARDANO_ROOT_PLUS * h_1_term - h_2_term
     )
     H_3_Cardano = (
-        -(1 + 1j * np.sqrt(3)) / (6 * 2 ** (1 / 3)) * h_t_coefficient
-        + (1 - 1j * np.sqrt(3))
-        * (3 * h_1_coefficient - h_2_coefficient**2)
-        / (3 * 2 ** (2 / 3) * h_t_coefficient)
-        - h_2_coefficient / 3
+        -_CARDANO_ROOT_PLUS * h_t_term + _CARDANO_ROOT_MINUS * h_1_term - h_2_term
     )
     return H_1_Cardano, H_2_Cardano, H_3_Cardano
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from abc import ABC
 import pathlib
-from typing import Callable, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from h5netcdf.legacyapi import Dataset
 import numpy as np
@@ -91,12 +91,35 @@ class MagneticField(ABC):
 
     def unit(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
         r"""Returns :math:`\mathbf{B}/|B|`, the unit vector of the magnetic field"""
-        magnitude = self.magnitude(q_R, q_Z)
         unit_vector = np.array(
             [self.B_R(q_R, q_Z), self.B_T(q_R, q_Z), self.B_Z(q_R, q_Z)]
         )
+        magnitude = np.sqrt(np.sum(unit_vector**2, axis=0))
         return (unit_vector / magnitude).T
 
+    def evaluate_all(self, q_R: ArrayLike, q_Z: ArrayLike) -> Dict[str, FloatArray]:
+        r"""Evaluate the field components, :math:`|B|`, :math:`\hat{\mathbf{b}}`
+        and :math:`\psi` together, looking up each component only once.
+
+        Returns
+        -------
+        dict
+            With keys ``"B_R"``, ``"B_T"``, ``"B_Z"``, ``"B_magnitude"``,
+            ``"b_hat"`` and ``"poloidal_flux"``
+        """
+        B_R = self.B_R(q_R, q_Z)
+        B_T = self.B_T(q_R, q_Z)
+        B_Z = self.B_Z(q_R, q_Z)
+        B_magnitude = np.sqrt(B_R**2 + B_T**2 + B_Z**2)
+        return {
+            "B_R": B_R,
+            "B_T": B_T,
+            "B_Z": B_Z,
+            "B_magnitude": B_magnitude,
+            "b_hat": (np.array([B_R, B_T, B_Z]) / B_magnitude).T,
+            "poloidal_flux": self.poloidal_flux(q_R, q_Z),
+        }
+
 
 class CircularCrossSectionField(MagneticField):
     """Simple circular cross-section magnetic geometry
@@ -141,11 +164,11 @@ class CircularCrossSectionField(MagneticField):
         )
 
     def rho(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return np.sqrt((q_R - self.R_axis) ** 2 + q_Z**2)
 
     def B_R(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return np.where(
             abs(q_Z) < 1e-12,
             0.0,
@@ -153,11 +176,11 @@ class CircularCrossSectionField(MagneticField):
         )
 
     def B_T(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return self.B_T_axis * (self.R_axis / q_R)
 
     def B_Z(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return np.where(
             abs(q_R - self.R_axis) < 1e-12,
             0.0,
@@ -167,7 +190,7 @@ class CircularCrossSectionField(MagneticField):
         )
 
     def poloidal_flux(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return self.rho(q_R, q_Z) / self.minor_radius_a
 
 
@@ -218,23 +241,23 @@ class ConstantCurrentDensityField(MagneticField):
         )
 
     def rho(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return np.sqrt((q_R - self.R_axis) ** 2 + q_Z**2)
 
     def B_R(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return self.B_p_a * q_Z / self.rho(q_R, q_Z)
 
     def B_T(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return self.B_T_axis * (self.R_axis / q_R)
 
     def B_Z(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return -self.B_p_a * (q_R - self.R_axis) / self.rho(q_R, q_Z)
 
     def poloidal_flux(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return self.rho(q_R, q_Z) / self.minor_radius_a
 
 
@@ -246,15 +269,15 @@ class CurvySlabField(MagneticField):
         self.R_axis = R_axis
 
     def B_R(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return np.zeros_like(q_R)
 
     def B_T(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return self.B_T_axis * self.R_axis / q_R
 
     def B_Z(self, q_R: ArrayLike, q_Z: ArrayLike) -> FloatArray:
-        q_R, q_Z = np.asfarray(q_R), np.asfarray(q_Z)
+        q_R, q_Z = np.asarray(q_R, dtype=np.float64), np.asarray(q_Z, dtype=np.float64)
         return np.zeros_like(q_R)
 
 
@@ -200,6 +200,61 @@ class Hamiltonian:
 
         """
 
+        K_magnitude, Booker_alpha, Booker_beta, H_discriminant = self._Booker_terms(
+            q_R, q_Z, K_R, K_zeta, K_Z
+        )
+        return (K_magnitude / self.wavenumber_K0) ** 2 + (
+            Booker_beta - self.mode_flag * np.sqrt(H_discriminant)
+        ) / (2 * Booker_alpha)
+
+    def both_modes(
+        self,
+        q_R: ArrayLike,
+        q_Z: ArrayLike,
+        K_R: ArrayLike,
+        K_zeta: ArrayLike,
+        K_Z: ArrayLike,
+    ) -> Tuple[ArrayLike, ArrayLike]:
+        """Evaluate the Hamiltonian at the given coordinates for both this
+        mode and the opposite one (that is, the opposite sign of the
+        discriminant in the Booker quartic), sharing all the work between them
+
+        Parameters
+        ----------
+        q_R : ArrayLike
+        q_Z : ArrayLike
+        K_R : ArrayLike
+        K_zeta : ArrayLike
+        K_Z : ArrayLike
+
+        Returns
+        -------
+        H, H_other
+            The Hamiltonian for ``mode_flag`` and ``-mode_flag`` respectively
+
+        """
+
+        K_magnitude, Booker_alpha, Booker_beta, H_discriminant = self._Booker_terms(
+            q_R, q_Z, K_R, K_zeta, K_Z
+        )
+        n_sq = (K_magnitude / self.wavenumber_K0) ** 2
+        mode_term = self.mode_flag * np.sqrt(H_discriminant)
+        return (
+            n_sq + (Booker_beta - mode_term) / (2 * Booker_alpha),
+            n_sq + (Booker_beta + mode_term) / (2 * Booker_alpha),
+        )
+
+    def _Booker_terms(
+        self,
+        q_R: ArrayLike,
+        q_Z: ArrayLike,
+        K_R: ArrayLike,
+        K_zeta: ArrayLike,
+        K_Z: ArrayLike,
+    ) -> Tuple[ArrayLike, ArrayLike, ArrayLike, ArrayLike]:
+        r"""Mode-independent pieces of the Hamiltonian: :math:`|K|`, the Booker
+        :math:`\alpha` and :math:`\beta` coefficients, and the discriminant"""
+
         K_magnitude = np.sqrt(K_R**2 + (K_zeta / q_R) ** 2 + K_Z**2)
         poloidal_flux = self.field.poloidal_flux(q_R, q_Z)
         electron_density = self.density(poloidal_flux)
@@ -242,9 +297,7 @@ class Hamiltonian:
             (Booker_beta**2 - 4 * Booker_alpha * Booker_gamma),
         )
 
-        return (K_magnitude / self.wavenumber_K0) ** 2 + (
-            Booker_beta - self.mode_flag * np.sqrt(H_discriminant)
-        ) / (2 * Booker_alpha)
+        return K_magnitude, Booker_alpha, Booker_beta, H_discriminant
 
     def derivatives(
         self,
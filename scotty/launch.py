@@ -2,11 +2,9 @@
 # SPDX-License-Identifier: GPL-3.0
 
 from scotty.fun_general import (
-    make_array_3x3,
     find_Psi_3D_lab,
     apply_discontinuous_BC,
     apply_continuous_BC,
-    find_inverse_2D,
     find_K_lab_Cartesian,
     find_K_lab,
     angular_frequency_to_wavenumber,
@@ -21,6 +19,7 @@ from scotty.fun_general import (
 )
 
 from typing import Union
+import math
 import warnings
 
 import numpy as np
@@ -101,17 +100,17 @@ def launch_beam(
 
     if Psi_BC_flag is True:
         warnings.warn(
-            "Boolean `Psi_BC_flag` is deprecated, please use None, 'continuous', or 'discontinuous'",
+            "Boolean `Psi_BC_flag` is deprecated, please use None, 'continuous', or 'discontinuous'. "
+            "Setting Psi_BC_flag = 'continuous' for backward compatibility",
             DeprecationWarning,
         )
-        print("Setting Psi_BC_flag = 'continuous' for backward compatibility")
         Psi_BC_flag = "continuous"
     elif Psi_BC_flag is False:
         warnings.warn(
-            "Boolean `Psi_BC_flag` is deprecated, please use None, 'continuous', or 'discontinuous'",
+            "Boolean `Psi_BC_flag` is deprecated, please use None, 'continuous', or 'discontinuous'. "
+            "Setting Psi_BC_flag = None for backward compatibility",
             DeprecationWarning,
         )
-        print("Setting Psi_BC_flag = None for backward compatibility ")
         Psi_BC_flag = None
     elif (
         (Psi_BC_flag is not None)
@@ -122,53 +121,38 @@ def launch_beam(
             f"Unexpected value for `Psi_BC_flag` ({Psi_BC_flag}), expected one of None, 'continuous, or 'discontinuous'"
         )
 
-    toroidal_launch_angle = np.deg2rad(toroidal_launch_angle_Torbeam)
-    poloidal_launch_angle = np.deg2rad(poloidal_launch_angle_Torbeam)
+    # Everything here is a scalar, so use `math` rather than paying
+    # for numpy's ufunc dispatch
+    toroidal_launch_angle = math.radians(toroidal_launch_angle_Torbeam)
+    poloidal_launch_angle = math.radians(poloidal_launch_angle_Torbeam)
+    cos_toroidal = math.cos(toroidal_launch_angle)
+    sin_toroidal = math.sin(toroidal_launch_angle)
+    cos_poloidal = math.cos(poloidal_launch_angle)
+    sin_poloidal = math.sin(poloidal_launch_angle)
 
     wavenumber_K0 = angular_frequency_to_wavenumber(launch_angular_frequency)
 
-    K_R_launch = (
-        -wavenumber_K0 * np.cos(toroidal_launch_angle) * np.cos(poloidal_launch_angle)
-    )
-    K_zeta_launch = (
-        -wavenumber_K0
-        * np.sin(toroidal_launch_angle)
-        * np.cos(poloidal_launch_angle)
-        * launch_position[0]
-    )
-    K_Z_launch = -wavenumber_K0 * np.sin(poloidal_launch_angle)
+    K_R_launch = -wavenumber_K0 * cos_toroidal * cos_poloidal
+    K_zeta_launch = -wavenumber_K0 * sin_toroidal * cos_poloidal * launch_position[0]
+    K_Z_launch = -wavenumber_K0 * sin_poloidal
     launch_K = np.array([K_R_launch, K_zeta_launch, K_Z_launch])
 
-    poloidal_rotation_angle = poloidal_launch_angle + (np.pi / 2)
-
+    # The beam is circular at launch, so Psi_w is a multiple of the
+    # identity. We only need to keep track of the diagonal element,
+    # which makes inverting and propagating it scalar arithmetic
     Psi_w_beam_diagonal = (
         wavenumber_K0 * launch_beam_curvature + 2j * launch_beam_width ** (-2)
     )
-    Psi_w_beam_launch_cartersian = np.eye(2) * Psi_w_beam_diagonal
 
-    rotation_matrix_pol = np.array(
-        [
-            [np.cos(poloidal_rotation_angle), 0, np.sin(poloidal_rotation_angle)],
-            [0, 1, 0],
-            [-np.sin(poloidal_rotation_angle), 0, np.cos(poloidal_rotation_angle)],
-        ]
+    rotation_matrix = launch_rotation_matrix(
+        toroidal_launch_angle, poloidal_launch_angle
     )
 
-    rotation_matrix_tor = np.array(
-        [
-            [np.cos(toroidal_launch_angle), np.sin(toroidal_launch_angle), 0],
-            [-np.sin(toroidal_launch_angle), np.cos(toroidal_launch_angle), 0],
-            [0, 0, 1],
-        ]
+    Psi_3D_beam_launch_cartersian = np.diag(
+        [Psi_w_beam_diagonal, Psi_w_beam_diagonal, 0.0]
     )
-
-    rotation_matrix = np.matmul(rotation_matrix_pol, rotation_matrix_tor)
-    rotation_matrix_inverse = np.transpose(rotation_matrix)
-
-    Psi_3D_beam_launch_cartersian = make_array_3x3(Psi_w_beam_launch_cartersian)
-    Psi_3D_lab_launch_cartersian = np.matmul(
-        rotation_matrix_inverse,
-        np.matmul(Psi_3D_beam_launch_cartersian, rotation_matrix),
+    Psi_3D_lab_launch_cartersian = _rotate_3x3(
+        Psi_3D_beam_launch_cartersian, rotation_matrix
     )
     Psi_3D_lab_launch = find_Psi_3D_lab(
         Psi_3D_lab_launch_cartersian,
@@ -190,8 +174,6 @@ def launch_beam(
             None,
         )
 
-    Psi_w_beam_inverse_launch_cartersian = find_inverse_2D(Psi_w_beam_launch_cartersian)
-
     entry_position = find_entry_point(
         launch_position,
         poloidal_launch_angle,
@@ -200,13 +182,13 @@ def launch_beam(
         field,
     )
 
-    distance_from_launch_to_entry = np.sqrt(
+    distance_from_launch_to_entry = math.sqrt(
         launch_position[0] ** 2
         + entry_position[0] ** 2
         - 2
         * launch_position[0]
         * entry_position[0]
-        * np.cos(entry_position[1] - launch_position[1])
+        * math.cos(entry_position[1] - launch_position[1])
         + (launch_position[2] - entry_position[2]) ** 2
     )
 
@@ -222,18 +204,18 @@ def launch_beam(
     K_zeta_entry = K_lab_entry[1]
     K_Z_entry = K_lab_entry[2]  # K_z
 
-    Psi_w_beam_inverse_entry_cartersian = (
-        distance_from_launch_to_entry / (wavenumber_K0) * np.eye(2)
-        + Psi_w_beam_inverse_launch_cartersian
+    # Propagating through vacuum just adds the distance travelled to the
+    # inverse of Psi_w, which stays a multiple of the identity
+    Psi_w_beam_entry_diagonal = 1 / (
+        distance_from_launch_to_entry / wavenumber_K0 + 1 / Psi_w_beam_diagonal
     )
     # 'entry' is still in vacuum, so the components of Psi along g are
     # all 0 (since \nabla H = 0)
-    Psi_3D_beam_entry_cartersian = make_array_3x3(
-        find_inverse_2D(Psi_w_beam_inverse_entry_cartersian)
+    Psi_3D_beam_entry_cartersian = np.diag(
+        [Psi_w_beam_entry_diagonal, Psi_w_beam_entry_diagonal, 0.0]
     )
-    Psi_3D_lab_entry_cartersian = np.matmul(
-        rotation_matrix_inverse,
-        np.matmul(Psi_3D_beam_entry_cartersian, rotation_matrix),
+    Psi_3D_lab_entry_cartersian = _rotate_3x3(
+        Psi_3D_beam_entry_cartersian, rotation_matrix
     )
 
     # Convert to cylindrical coordinates
@@ -352,12 +334,13 @@ def find_entry_point(
     step_array = np.array((X_step, Y_step, Z_step))
 
     def beam_line(tau):
-        """Parameterised line in beam direction"""
-        return launch_position + tau * step_array
+        """Parameterised line in beam direction. For an array of
+        ``tau``, returns an array of points with shape ``(len(tau), 3)``"""
+        return launch_position + np.multiply.outer(tau, step_array)
 
     def poloidal_flux_boundary_along_line(tau):
         """Signed poloidal flux distance to plasma boundary"""
-        R, _, Z = cartesian_to_cylindrical(*beam_line(tau))
+        R, _, Z = cartesian_to_cylindrical(*np.transpose(beam_line(tau)))
         return field.poloidal_flux(R, Z) - poloidal_flux_enter
 
     # If max_length is *really* big, then our parameterised beam line
@@ -366,9 +349,8 @@ def find_entry_point(
     # 10 points inside the plasma, with a minimum of 100 total
     N_steps = int(10 * max_length / (field.R_coord.max() - field.R_coord.min()))
     tau = np.linspace(0, 1, max(100, N_steps))
-    spline = CubicSpline(
-        tau, [poloidal_flux_boundary_along_line(t) for t in tau], extrapolate=False
-    )
+    # Evaluate the flux at every point along the line in one go
+    spline = CubicSpline(tau, poloidal_flux_boundary_along_line(tau), extrapolate=False)
     spline_roots = spline.roots()
 
     # If there are no roots, then the beam never actually enters the
@@ -401,3 +383,43 @@ def find_entry_point(
         boundary_tau += boundary_adjust
 
     return np.array(cartesian_to_cylindrical(*beam_line(boundary_tau)))
+
+
+def launch_rotation_matrix(
+    toroidal_launch_angle: float, poloidal_launch_angle: float
+) -> FloatArray:
+    """Rotation matrix from the lab Cartesian frame to the beam frame
+    of an antenna with the given launch angles (radians)"""
+    # The poloidal rotation is through poloidal_launch_angle + pi/2, so
+    # use cos(x + pi/2) = -sin(x) and sin(x + pi/2) = cos(x)
+    cos_pol = -math.sin(poloidal_launch_angle)
+    sin_pol = math.cos(poloidal_launch_angle)
+    cos_tor = math.cos(toroidal_launch_angle)
+    sin_tor = math.sin(toroidal_launch_angle)
+
+    rotation_matrix_pol = np.array(
+        [
+            [cos_pol, 0.0, sin_pol],
+            [0.0, 1.0, 0.0],
+            [-sin_pol, 0.0, cos_pol],
+        ]
+    )
+    rotation_matrix_tor = np.array(
+        [
+            [cos_tor, sin_tor, 0.0],
+            [-sin_tor, cos_tor, 0.0],
+            [0.0, 0.0, 1.0],
+        ]
+    )
+
+    return rotation_matrix_pol @ rotation_matrix_tor
+
+
+def _rotate_3x3(matrix: FloatArray, rotation_matrix: FloatArray) -> FloatArray:
+    """Compute ``rotation_matrix.T @ matrix @ rotation_matrix``. The
+    inverse of a rotation is its transpose, so rather than forming it
+    we pass ``matmul`` a transposed view of ``rotation_matrix``.
+
+    A single ``einsum`` over all three matrices is slower than the two
+    ``matmul`` calls at this size, so don't swap it in"""
+    return rotation_matrix.T @ (matrix @ rotation_matrix)
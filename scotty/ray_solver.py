@@ -302,7 +302,15 @@ def handle_no_resonance(
     ray_parameters_2D = solver_ray_output.y
     tau_ray = solver_ray_output.t
 
-    max_tau_idx = int(np.argmax(tau_ray[tau_ray <= tau_leave]))
+    # tau_ray is increasing, so this is the index of the last point at
+    # or before the ray leaves the plasma. Note that slicing with
+    # ``[:max_tau_idx]`` then excludes that point itself
+    max_tau_idx = int(np.searchsorted(tau_ray, tau_leave, side="right")) - 1
+    if max_tau_idx < 0:
+        raise RuntimeError(
+            f"Ray leaves the plasma (tau = {tau_leave}) before the first "
+            f"ray point (tau = {tau_ray[0]})"
+        )
 
     K_magnitude_ray = K_magnitude(
         K_R=ray_parameters_2D[2, :max_tau_idx],
@@ -0,0 +1,108 @@
+from scotty.analysis import dispersion_eigenvalues, grad_H_Cardano
+from scotty.derivatives import derivative
+from scotty.fun_general import (
+    K_magnitude,
+    find_D,
+    find_H_Cardano,
+    freq_GHz_to_angular_frequency,
+)
+
+import numpy as np
+import numpy.testing as npt
+import xarray as xr
+
+
+def test_grad_H_Cardano_nonzero_toroidal_angle():
+    launch_angular_frequency = freq_GHz_to_angular_frequency(55.0)
+    q_R = np.array([2.2, 2.0, 1.8])
+    # Roughly a 5 degree toroidal launch, so K_zeta is not small
+    K_R = np.array([-1100.0, -800.0, -300.0])
+    K_zeta = -100.0 * q_R[0]
+    K_Z = np.array([-120.0, -200.0, -250.0])
+    epsilon_para = np.array([0.9, 0.7, 0.5])
+    epsilon_perp = np.array([0.85, 0.6, 0.45])
+    epsilon_g = np.array([0.05, 0.2, 0.3])
+    theta_m = np.array([0.02, 0.05, 0.1])
+    cardano_index = 2
+
+    def H_cardano(K_R, K_zeta, K_Z):
+        return find_H_Cardano(
+            K_magnitude(K_R, K_zeta, K_Z, q_R),
+            launch_angular_frequency,
+            epsilon_para,
+            epsilon_perp,
+            epsilon_g,
+            theta_m,
+        )[cardano_index]
+
+    args = {"K_R": K_R, "K_zeta": K_zeta, "K_Z": K_Z}
+    expected = [
+        derivative(H_cardano, direction, args=args, spacings=0.1, use_cache=False)
+        for direction in ["K_R", "K_zeta", "K_Z"]
+    ]
+
+    gradient = grad_H_Cardano(
+        K_R,
+        K_zeta,
+        K_Z,
+        q_R,
+        K_magnitude(K_R, K_zeta, K_Z, q_R),
+        launch_angular_frequency,
+        epsilon_para,
+        epsilon_perp,
+        epsilon_g,
+        theta_m,
+        cardano_index,
+        delta_K=0.1,
+    )
+
+    for direction, g, g_expected in zip(["R", "zeta", "Z"], gradient, expected):
+        npt.assert_allclose(g, g_expected, rtol=1e-6, err_msg=direction)
+
+
+def test_dispersion_eigenvalues_real_path_matches_complex_eigh():
+    launch_angular_frequency = freq_GHz_to_angular_frequency(55.0)
+    K_magnitude_array = np.array([1150.0, 900.0, 600.0, 450.0])
+    theta_m = np.array([0.02, 0.05, 0.1, -0.03])
+    df = xr.Dataset(
+        {
+            "epsilon_para": ("tau", [0.9, 0.7, 0.5, 0.3]),
+            "epsilon_perp": ("tau", [0.85, 0.6, 0.45, 0.25]),
+            "epsilon_g": ("tau", [0.05, 0.2, 0.3, 0.4]),
+        }
+    )
+
+    eigenvalues, eigenvectors = dispersion_eigenvalues(
+        K_magnitude_array, launch_angular_frequency, df, 4, theta_m
+    )
+
+    D_11, D_22, D_bb, D_12, D_1b = find_D(
+        K_magnitude_array,
+        launch_angular_frequency,
+        df.epsilon_para.values,
+        df.epsilon_perp.values,
+        df.epsilon_g.values,
+        theta_m,
+    )
+    zero = np.zeros(4)
+    # fmt: off
+    D_tensor = np.stack(
+        [
+            D_11,        -1j * D_12, D_1b,
+            1j * D_12,   D_22,       zero,
+            D_1b,        zero,       D_bb,
+        ],
+        axis=-1,
+    ).reshape(4, 3, 3)
+    # fmt: on
+    expected_eigenvalues, expected_eigenvectors = np.linalg.eigh(D_tensor)
+
+    npt.assert_allclose(eigenvalues, expected_eigenvalues, rtol=1e-12, atol=1e-12)
+    # Eigenvectors are only defined up to a phase, so compare their overlap
+    overlap = np.einsum("nij,nij->nj", expected_eigenvectors.conj(), eigenvectors)
+    npt.assert_allclose(np.abs(overlap), 1.0, rtol=1e-12)
+    npt.assert_allclose(
+        D_tensor @ eigenvectors,
+        eigenvectors * eigenvalues[:, np.newaxis, :],
+        atol=1e-12,
+    )
@@ -0,0 +1,41 @@
+from scotty.fun_evolution import pack_beam_parameters, unpack_beam_parameters
+
+import numpy as np
+import numpy.testing as npt
+
+
+def test_pack_unpack_beam_parameters():
+    Psi = np.array(
+        [
+            [1.0 + 2.0j, 3.0 + 4.0j, 5.0 + 6.0j],
+            [3.0 + 4.0j, 7.0 + 8.0j, 9.0 + 10.0j],
+            [5.0 + 6.0j, 9.0 + 10.0j, 11.0 + 12.0j],
+        ]
+    )
+
+    beam_parameters = pack_beam_parameters(0.1, 0.2, 0.3, 0.4, 0.5, Psi)
+
+    npt.assert_array_equal(
+        beam_parameters,
+        [0.1, 0.2, 0.3, 0.4, 0.5, 1, 7, 11, 3, 5, 9, 2, 8, 12, 4, 6, 10],
+    )
+
+    q_R, q_zeta, q_Z, K_R, K_Z, Psi_unpacked = unpack_beam_parameters(beam_parameters)
+    npt.assert_array_equal([q_R, q_zeta, q_Z, K_R, K_Z], [0.1, 0.2, 0.3, 0.4, 0.5])
+    npt.assert_array_equal(Psi_unpacked, Psi)
+
+
+def test_unpack_beam_parameters_many_points():
+    rng = np.random.default_rng(1234)
+    beam_parameters = rng.random((17, 4))
+
+    *_, Psi = unpack_beam_parameters(beam_parameters)
+
+    assert Psi.shape == (4, 3, 3)
+    npt.assert_array_equal(Psi, np.swapaxes(Psi, 1, 2))
+    npt.assert_array_equal(Psi[:, 0, 2], beam_parameters[9] + 1j * beam_parameters[15])
+    for n in range(4):
+        npt.assert_array_equal(
+            pack_beam_parameters(*beam_parameters[:5, n], Psi[n]),
+            beam_parameters[:, n],
+        )
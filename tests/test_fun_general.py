@@ -1,6 +1,9 @@
 from scotty.fun_general import (
     freq_GHz_to_wavenumber,
     find_nearest,
+    find_x0,
+    find_inverse_2D,
+    make_unit_vector_from_cross_product,
     read_floats_into_list_until,
     find_Psi_3D_lab,
     find_Psi_3D_lab_Cartesian,
@@ -33,6 +36,29 @@ def test_find_nearest():
     assert find_nearest(data, 10) == 4
 
 
+def test_find_x0():
+    xs = np.linspace(0, 2, 21)
+    assert np.isclose(find_x0(xs, 3 * xs, 1.5), 0.5)
+    # Unsorted xs should give the same answer
+    assert np.isclose(find_x0(xs[::-1], 3 * xs[::-1], 1.5), 0.5)
+
+
+def test_find_inverse_2D():
+    matrix = np.array([[1.0 + 2.0j, 0.5], [0.5, 3.0 - 1.0j]])
+    npt.assert_allclose(find_inverse_2D(matrix) @ matrix, np.eye(2), atol=1e-15)
+
+
+def test_make_unit_vector_from_cross_product():
+    x_hat = np.array([1.0, 0.0, 0.0])
+    y_hat = np.array([0.0, 2.0, 0.0])
+    npt.assert_allclose(make_unit_vector_from_cross_product(x_hat, y_hat), [0, 0, 1])
+
+    vectors_a = np.array([[3.0, 0.0, 0.0], [0.0, 0.0, 0.5]])
+    npt.assert_allclose(
+        make_unit_vector_from_cross_product(vectors_a, y_hat), [[0, 0, 1], [-1, 0, 0]]
+    )
+
+
 def test_read_floats_into_list():
     data = io.StringIO(
         dedent(
@@ -107,6 +133,11 @@ def test_convert_Psi_roundtrip():
     npt.assert_allclose(Psi_cartesian.imag, np.zeros_like(Psi_original))
 
 
+def test_find_Psi_3D_lab_Cartesian_bad_shape():
+    with pytest.raises(ValueError):
+        find_Psi_3D_lab_Cartesian(np.zeros(3), 2, np.pi, 42, 64)
+
+
 def test_Psi_cylindrical():
     xx = 1
     yy = 2
@@ -173,3 +173,22 @@ def test_interpolated():
         circular_field.poloidal_flux(R_midplane, 0.0),
         rtol=1e-3,
     )
+
+
+def test_evaluate_all():
+    field = geometry.CircularCrossSectionField(
+        B_T_axis=1.0, R_axis=2.0, minor_radius_a=1.0, B_p_a=0.5
+    )
+    # Avoid the magnetic axis, where B_p is undefined
+    R = np.linspace(1.5, 2.5, 6)
+    Z = np.linspace(-0.5, 0.5, 6)
+
+    result = field.evaluate_all(R, Z)
+
+    npt.assert_allclose(result["B_R"], field.B_R(R, Z))
+    npt.assert_allclose(result["B_T"], field.B_T(R, Z))
+    npt.assert_allclose(result["B_Z"], field.B_Z(R, Z))
+    npt.assert_allclose(result["B_magnitude"], field.magnitude(R, Z))
+    npt.assert_allclose(result["b_hat"], field.unit(R, Z))
+    npt.assert_allclose(result["poloidal_flux"], field.poloidal_flux(R, Z))
+    assert result["b_hat"].shape == (len(R), 3)
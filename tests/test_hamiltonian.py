@@ -176,3 +176,24 @@ def test_golden():
     )
     expected = -0.2632447148279265
     assert np.isclose(H(1.75, 0.1, 1, 1, 1), expected)
+
+
+def test_both_modes():
+    kwargs_dict = get_parameters_for_Scotty("DBS_synthetic")
+    kwargs_dict["find_B_method"] = "unit-tests"
+    field = create_magnetic_geometry(**kwargs_dict)
+    density = kwargs_dict["density_fit_method"]
+    angular_frequency = freq_GHz_to_angular_frequency(kwargs_dict["launch_freq_GHz"])
+    mode_flag = kwargs_dict["mode_flag"]
+    spacings = (1e-3, 1e-3, 1e-3, 1e-3, 1e-3)
+    H = Hamiltonian(field, angular_frequency, mode_flag, density, *spacings)
+    H_other = Hamiltonian(field, angular_frequency, -mode_flag, density, *spacings)
+
+    q_R = np.array([1.75, 1.8])
+    q_Z = np.array([0.1, -0.1])
+    K_R = np.array([1.0, -2.0])
+    K_Z = np.array([1.0, 0.5])
+
+    H_this, H_that = H.both_modes(q_R, q_Z, K_R, 1.0, K_Z)
+    assert_allclose(H_this, H(q_R, q_Z, K_R, 1.0, K_Z))
+    assert_allclose(H_that, H_other(q_R, q_Z, K_R, 1.0, K_Z))
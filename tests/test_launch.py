@@ -0,0 +1,104 @@
+from scotty.fun_general import (
+    find_Psi_3D_lab,
+    freq_GHz_to_angular_frequency,
+    angular_frequency_to_wavenumber,
+    make_array_3x3,
+)
+from scotty.geometry import CircularCrossSectionField
+from scotty.hamiltonian import Hamiltonian
+from scotty.launch import (
+    launch_beam,
+    launch_rotation_matrix,
+)
+from scotty.profile_fit import QuadraticFit
+
+import numpy as np
+import numpy.testing as npt
+
+
+def test_launch_rotation_matrix():
+    # Launching horizontally along the negative R axis, the beam
+    # frame's z-axis points along R
+    rotation_matrix = launch_rotation_matrix(0.0, 0.0)
+    npt.assert_allclose(rotation_matrix @ [0, 0, 1], [1, 0, 0], atol=1e-15)
+    npt.assert_allclose(rotation_matrix @ rotation_matrix.T, np.eye(3), atol=1e-15)
+
+
+def test_launch_beam_Psi_matches_full_matrices():
+    """`launch_beam` only tracks the diagonal element of the circular
+    Psi_w, check that against building and rotating the full matrices"""
+    field = CircularCrossSectionField(
+        B_T_axis=1.0, R_axis=1.5, minor_radius_a=0.5, B_p_a=0.1
+    )
+    launch_angular_frequency = freq_GHz_to_angular_frequency(55.0)
+    hamiltonian = Hamiltonian(
+        field,
+        launch_angular_frequency,
+        mode_flag=1,
+        density_fit=QuadraticFit(1.0, 4.0),
+        delta_R=-1e-4,
+        delta_Z=1e-4,
+        delta_K_R=0.1,
+        delta_K_zeta=0.1,
+        delta_K_Z=0.1,
+    )
+    toroidal_launch_angle_Torbeam = 5.0
+    poloidal_launch_angle_Torbeam = 6.0
+    launch_beam_width = 0.04
+    launch_beam_curvature = -0.25
+    launch_position = np.array([2.587, 0.0, -0.0157])
+
+    (
+        _,
+        _,
+        launch_K,
+        _,
+        Psi_3D_lab_launch,
+        _,
+        Psi_3D_lab_entry_cartersian,
+        distance_from_launch_to_entry,
+    ) = launch_beam(
+        toroidal_launch_angle_Torbeam=toroidal_launch_angle_Torbeam,
+        poloidal_launch_angle_Torbeam=poloidal_launch_angle_Torbeam,
+        launch_beam_width=launch_beam_width,
+        launch_beam_curvature=launch_beam_curvature,
+        launch_position=launch_position,
+        launch_angular_frequency=launch_angular_frequency,
+        mode_flag=1,
+        field=field,
+        hamiltonian=hamiltonian,
+        Psi_BC_flag=None,
+    )
+
+    wavenumber_K0 = angular_frequency_to_wavenumber(launch_angular_frequency)
+    rotation_matrix = launch_rotation_matrix(
+        np.deg2rad(toroidal_launch_angle_Torbeam),
+        np.deg2rad(poloidal_launch_angle_Torbeam),
+    )
+    Psi_w_launch = (
+        wavenumber_K0 * launch_beam_curvature + 2j * launch_beam_width ** (-2)
+    ) * np.eye(2)
+    expected_Psi_3D_lab_launch = find_Psi_3D_lab(
+        rotation_matrix.T @ make_array_3x3(Psi_w_launch) @ rotation_matrix,
+        launch_position[0],
+        launch_position[1],
+        launch_K[0],
+        launch_K[1],
+    )
+    Psi_w_entry = np.linalg.inv(
+        distance_from_launch_to_entry / wavenumber_K0 * np.eye(2)
+        + np.linalg.inv(Psi_w_launch)
+    )
+    expected_Psi_3D_lab_entry_cartersian = (
+        rotation_matrix.T @ make_array_3x3(Psi_w_entry) @ rotation_matrix
+    )
+
+    npt.assert_allclose(
+        Psi_3D_lab_launch, expected_Psi_3D_lab_launch, rtol=1e-12, atol=1e-9
+    )
+    npt.assert_allclose(
+        Psi_3D_lab_entry_cartersian,
+        expected_Psi_3D_lab_entry_cartersian,
+        rtol=1e-12,
+        atol=1e-9,
+    )
@@ -0,0 +1,20 @@
+from scotty.ray_solver import handle_no_resonance
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+
+def test_handle_no_resonance_leaves_before_first_point():
+    solver_ray_output = SimpleNamespace(t=np.array([1.0, 2.0, 3.0]), y=np.zeros((4, 3)))
+
+    with pytest.raises(RuntimeError, match="before the first ray point"):
+        handle_no_resonance(
+            solver_ray_output,
+            tau_leave=0.5,
+            tau_points=np.linspace(0.0, 3.0, 4),
+            K_zeta=0.0,
+            solver_arguments=None,
+            event_leave_plasma=None,
+        )
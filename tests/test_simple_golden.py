@@ -3,6 +3,7 @@ from scotty.beam_me_up import (
     create_magnetic_geometry,
     make_density_fit,
 )
+from scotty.analysis import DIAGNOSTIC_VARIABLES
 from scotty.init_bruv import get_parameters_for_Scotty
 from scotty.torbeam import Torbeam
 from scotty.geometry import CircularCrossSectionField
@@ -1285,6 +1286,46 @@ def test_null_relativistic_X_mode(tmp_path, generator_nullrelneg):
     )
 
 
+@pytest.fixture
+def simple_run_kwargs(tmp_path):
+    """Arguments for a short run of the built-in synthetic diagnostic,
+    without figures"""
+    kwargs_dict = simple(tmp_path)
+    kwargs_dict["figure_flag"] = False
+    kwargs_dict["len_tau"] = 10
+    kwargs_dict["output_path"] = tmp_path
+    return kwargs_dict
+
+
+def test_diagnostics_single_precision(simple_run_kwargs):
+    """Diagnostic-only outputs are stored in single precision, while
+    the beam state and everything derived from it stays in double"""
+    output = beam_me_up(**simple_run_kwargs)
+
+    analysis = output["analysis"]
+    for name in DIAGNOSTIC_VARIABLES:
+        assert analysis[name].dtype in (np.float32, np.complex64), name
+
+    for name in ["q_R", "q_zeta", "q_Z", "K_R", "K_Z", "Psi_3D"]:
+        assert output["solver_output"][name].dtype in (
+            np.float64,
+            np.complex128,
+        ), name
+    for name in ["K_R", "Psi_3D", "M_xy", "loc_b", "H_eigvals", "e_eigvecs"]:
+        assert analysis[name].dtype in (np.float64, np.complex128), name
+
+
+@pytest.mark.parametrize("debug_flag", [False, True])
+def test_debug_outputs(simple_run_kwargs, debug_flag):
+    """Debug-only outputs are only computed with ``debug_flag``"""
+    if debug_flag:
+        simple_run_kwargs["debug_flag"] = True
+
+    output = beam_me_up(**simple_run_kwargs)["analysis"]
+
+    assert ("H_Booker_other" in output) == debug_flag
+
+
 @pytest.mark.parametrize(
     "generator",
     [